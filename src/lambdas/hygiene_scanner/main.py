@@ -1,15 +1,104 @@
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
+from typing import Iterator
 
 import boto3
+from botocore.config import Config
 
+try:
+    import orjson
+except ImportError:  # not bundled with the Lambda runtime; stdlib json is the fallback
+    orjson = None
 
-ec2 = boto3.client("ec2")
-cloudwatch = boto3.client("cloudwatch")
-logs = boto3.client("logs")
-eks = boto3.client("eks")
-elb = boto3.client("elbv2")
+
+def _env_price(name: str, default: float) -> float:
+    """Read a price override, falling back to the default if it is not a number."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Ignoring invalid {name}={value!r}; using default {default}")
+        return default
+
+
+# Rough list prices in USD, read once per container; override via environment variables.
+# EBS gp3 per GB-month
+_EBS_GB_MONTH_PRICE = _env_price("HYGIENE_EBS_GB_MONTH_PRICE", 0.08)
+# Snapshot per GB-month (snapshot size ~ volume size)
+_SNAPSHOT_GB_MONTH_PRICE = _env_price("HYGIENE_SNAPSHOT_GB_MONTH_PRICE", 0.05)
+# Unassociated Elastic IP per month
+_EIP_MONTH_PRICE = _env_price("HYGIENE_EIP_MONTH_PRICE", 3.5)
+# NAT Gateway per month
+_NAT_MONTH_PRICE = _env_price("HYGIENE_NAT_MONTH_PRICE", 32.0)
+# ALB / NLB fixed price per month (does not include LCU usage)
+_ELB_MONTH_PRICE = _env_price("HYGIENE_ELB_MONTH_PRICE", 18.0)
+
+# Empty log groups cost nothing; set HYGIENE_SCAN_EMPTY_LOG_GROUPS=0 to leave them out of the report
+_SCAN_EMPTY_LOG_GROUPS = os.getenv("HYGIENE_SCAN_EMPTY_LOG_GROUPS", "1") != "0"
+
+# The EKS namespace scan is a placeholder; only run it when explicitly enabled
+_SCAN_EKS = os.getenv("HYGIENE_SCAN_EKS") == "1"
+
+# Shared by every untagged finding; findings only ever read their tags.
+_EMPTY_TAGS: dict = {}
+
+# Costs are summed as integers in units of 1e-4 USD, so the total is exact. Each
+# scan converts a cost to units once and yields (cost_units, finding) pairs.
+_COST_SCALE = 10_000
+
+# Adaptive retries rate-limit client-side on throttling, and the larger pool lets
+# concurrent scans share a client without queueing for connections.
+_BOTO_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10}, max_pool_connections=64)
+
+_clients: dict[tuple[str, str], object] = {}
+_client_lock = threading.Lock()
+
+
+def _client(service: str, region: str):
+    """
+    Return a shared boto3 client for (service, region).
+
+    Clients are safe to share across threads for API calls, but creating them
+    through the default session is not. The cache is checked and filled under
+    one lock, so concurrent scans of a new region build each client only once.
+    """
+    key = (service, region)
+    with _client_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = boto3.client(service, region_name=region, config=_BOTO_CONFIG)
+        return client
+
+
+_DEFAULT_REGION = os.getenv("AWS_REGION", os.getenv("AWS_DEFAULT_REGION", "us-east-1"))
+
+
+def _warm_clients(region: str) -> None:
+    """Build the clients used by the enabled scans, so warm invocations reuse them."""
+    services = ["ec2", "cloudwatch", "elbv2"]
+    if _SCAN_EMPTY_LOG_GROUPS:
+        services.append("logs")
+    for service in services:
+        _client(service, region)
+
+
+# Runs once per container, during Lambda init
+_warm_clients(_DEFAULT_REGION)
+
+
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _to_json(obj) -> str:
+    """Serialize a response body compactly, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return _JSON_ENCODER.encode(obj)
 
 
 def _now_utc() -> datetime:
@@ -17,302 +106,356 @@ def _now_utc() -> datetime:
 
 
 def _days_between(start: datetime, end: datetime) -> int:
-    return max(0, int((end - start).total_seconds() // 86400))
-
-
-def _build_finding(
-    *,
-    resource_type: str,
-    resource_id: str,
-    region: str,
-    estimated_monthly_cost: float,
-    age_days: int | None = None,
-    tags: dict | None = None,
-    risk_level: str = "LOW",
-    recommended_action: str = "",
-    extra: dict | None = None,
-) -> dict:
-    finding = {
-        "resource_type": resource_type,
-        "resource_id": resource_id,
-        "region": region,
-        "estimated_monthly_cost": round(float(estimated_monthly_cost), 4),
-        "age_days": age_days,
-        "tags": tags or {},
-        "risk_level": risk_level,
-        "recommended_action": recommended_action,
-    }
-    if extra:
-        finding.update(extra)
-    return finding
+    return max(0, (end - start).days)
 
 
-def _get_volume_tags(volume: dict) -> dict:
-    return {t["Key"]: t["Value"] for t in volume.get("Tags", [])}
+def _to_cost_units(amount: float) -> int:
+    return round(amount * _COST_SCALE)
 
 
-def _scan_unattached_ebs(region: str) -> list[dict]:
+def _scan_unattached_ebs(region: str) -> Iterator[tuple[int, dict]]:
     """Detect unattached EBS volumes."""
-    regional_ec2 = boto3.client("ec2", region_name=region)
-    findings: list[dict] = []
+    regional_ec2 = _client("ec2", region)
+    now = _now_utc()
     paginator = regional_ec2.get_paginator("describe_volumes")
     for page in paginator.paginate(Filters=[{"Name": "status", "Values": ["available"]}]):
         for vol in page.get("Volumes", []):
             volume_id = vol["VolumeId"]
             size_gb = vol.get("Size", 0)
             create_time = vol.get("CreateTime")
-            age_days = _days_between(create_time, _now_utc()) if isinstance(create_time, datetime) else None
-
-            # Very rough, fixed EBS gp3 price approximation in USD per GB-month (can be tuned)
-            price_per_gb_month = float(os.getenv("HYGIENE_EBS_GB_MONTH_PRICE", "0.08"))
-            estimated_cost = size_gb * price_per_gb_month
-
-            findings.append(
-                _build_finding(
-                    resource_type="EBS_VOLUME",
-                    resource_id=volume_id,
-                    region=region,
-                    estimated_monthly_cost=estimated_cost,
-                    age_days=age_days,
-                    tags=_get_volume_tags(vol),
-                    risk_level="MEDIUM",
-                    recommended_action="Delete volume if no longer needed",
-                    extra={"size_gb": size_gb},
-                )
-            )
-    return findings
+            age_days = _days_between(create_time, now) if isinstance(create_time, datetime) else None
+
+            cost_units = _to_cost_units(size_gb * _EBS_GB_MONTH_PRICE)
+
+            yield cost_units, {
+                "resource_type": "EBS_VOLUME",
+                "resource_id": volume_id,
+                "region": region,
+                "estimated_monthly_cost": cost_units / _COST_SCALE,
+                "age_days": age_days,
+                "tags": {t["Key"]: t["Value"] for t in vol["Tags"]} if vol.get("Tags") else _EMPTY_TAGS,
+                "risk_level": "MEDIUM",
+                "recommended_action": "Delete volume if no longer needed",
+                "size_gb": size_gb,
+            }
 
 
-def _scan_old_snapshots(region: str, min_age_days: int = 3) -> list[dict]:
+def _scan_old_snapshots(region: str, min_age_days: int = 3) -> Iterator[tuple[int, dict]]:
     """Detect old EBS snapshots owned by this account."""
-    regional_ec2 = boto3.client("ec2", region_name=region)
-    findings: list[dict] = []
+    regional_ec2 = _client("ec2", region)
+    now = _now_utc()
+    # A snapshot is at least min_age_days old exactly when it started at or before the cutoff
+    cutoff = now - timedelta(days=min_age_days)
     paginator = regional_ec2.get_paginator("describe_snapshots")
-    for page in paginator.paginate(OwnerIds=["self"]):
+    # EC2 cannot filter snapshots by age server-side; narrow to completed ones and
+    # use the largest page size to minimise round-trips.
+    for page in paginator.paginate(
+        OwnerIds=["self"],
+        Filters=[{"Name": "status", "Values": ["completed"]}],
+        PaginationConfig={"PageSize": 1000},
+    ):
         for snap in page.get("Snapshots", []):
-            snap_id = snap["SnapshotId"]
             start_time = snap.get("StartTime")
-            age_days = _days_between(start_time, _now_utc()) if isinstance(start_time, datetime) else None
-            if age_days is None or age_days < min_age_days:
+            if not isinstance(start_time, datetime) or start_time > cutoff:
                 continue
 
-            # Simple approximation: snapshot size ~ volume size, 0.05 USD / GB-month
+            snap_id = snap["SnapshotId"]
+            age_days = (now - start_time).days
+
             size_gb = snap.get("VolumeSize", 0)
-            price_per_gb_month = float(os.getenv("HYGIENE_SNAPSHOT_GB_MONTH_PRICE", "0.05"))
-            estimated_cost = size_gb * price_per_gb_month
-
-            findings.append(
-                _build_finding(
-                    resource_type="EBS_SNAPSHOT",
-                    resource_id=snap_id,
-                    region=region,
-                    estimated_monthly_cost=estimated_cost,
-                    age_days=age_days,
-                    tags={t["Key"]: t["Value"] for t in snap.get("Tags", [])},
-                    risk_level="LOW",
-                    recommended_action="Review and delete stale snapshot if no longer required",
-                    extra={"size_gb": size_gb},
-                )
-            )
-    return findings
+            cost_units = _to_cost_units(size_gb * _SNAPSHOT_GB_MONTH_PRICE)
+
+            yield cost_units, {
+                "resource_type": "EBS_SNAPSHOT",
+                "resource_id": snap_id,
+                "region": region,
+                "estimated_monthly_cost": cost_units / _COST_SCALE,
+                "age_days": age_days,
+                "tags": {t["Key"]: t["Value"] for t in snap["Tags"]} if snap.get("Tags") else _EMPTY_TAGS,
+                "risk_level": "LOW",
+                "recommended_action": "Review and delete stale snapshot if no longer required",
+                "size_gb": size_gb,
+            }
 
 
-def _scan_unused_eips(region: str) -> list[dict]:
+def _scan_unused_eips(region: str) -> Iterator[tuple[int, dict]]:
     """Detect Elastic IPs not currently associated."""
-    regional_ec2 = boto3.client("ec2", region_name=region)
-    findings: list[dict] = []
+    regional_ec2 = _client("ec2", region)
+    cost_units = _to_cost_units(_EIP_MONTH_PRICE)
+    estimated_cost = cost_units / _COST_SCALE
+    # DescribeAddresses is not paginated: it always returns every address in the region
     addresses = regional_ec2.describe_addresses().get("Addresses", [])
     for addr in addresses:
         if addr.get("AssociationId"):
             continue
 
         allocation_id = addr.get("AllocationId") or addr.get("PublicIp")
-        # Very rough EIP cost estimate (~3.5 USD / month when unused)
-        estimated_cost = float(os.getenv("HYGIENE_EIP_MONTH_PRICE", "3.5"))
-
-        findings.append(
-            _build_finding(
-                resource_type="ELASTIC_IP",
-                resource_id=str(allocation_id),
-                region=region,
-                estimated_monthly_cost=estimated_cost,
-                age_days=None,
-                tags={},
-                risk_level="MEDIUM",
-                recommended_action="Release unused Elastic IP",
-            )
-        )
-    return findings
+        yield cost_units, {
+            "resource_type": "ELASTIC_IP",
+            "resource_id": str(allocation_id),
+            "region": region,
+            "estimated_monthly_cost": estimated_cost,
+            "age_days": None,
+            "tags": _EMPTY_TAGS,
+            "risk_level": "MEDIUM",
+            "recommended_action": "Release unused Elastic IP",
+        }
+
+
+# GetMetricData accepts at most 500 MetricDataQueries per request
+_METRIC_DATA_BATCH_SIZE = 500
+# Upper bound on concurrent CloudWatch requests, to stay clear of API throttling
+_METRIC_MAX_WORKERS = 16
+# Traffic lookback window; also used as the metric period so each query returns
+# a single aggregated datapoint (occasionally two, if CloudWatch realigns the window)
+_TRAFFIC_LOOKBACK = timedelta(days=7)
 
 
-def _metric_has_traffic(namespace: str, metric_name: str, dimensions: list[dict], region: str) -> bool:
-    regional_cw = boto3.client("cloudwatch", region_name=region)
+def _fetch_metric_sums(regional_cw, queries: list[dict], start_time: datetime, end_time: datetime) -> dict[str, float]:
+    """
+    Run one GetMetricData batch and return the summed values per query Id.
+
+    GetMetricData reports per-query failures in StatusCode rather than raising,
+    so only Ids whose final status is "Complete" are returned.
+    """
+    sums: dict[str, float] = {}
+    statuses: dict[str, str] = {}
+    paginator = regional_cw.get_paginator("get_metric_data")
+    for page in paginator.paginate(MetricDataQueries=queries, StartTime=start_time, EndTime=end_time):
+        for result in page.get("MetricDataResults", []):
+            query_id = result["Id"]
+            sums[query_id] = sums.get(query_id, 0.0) + sum(result.get("Values", []))
+            # PartialData on earlier pages becomes Complete on the page that finishes the query
+            statuses[query_id] = result.get("StatusCode", "")
+    return {query_id: total for query_id, total in sums.items() if statuses.get(query_id) == "Complete"}
+
+
+def _bulk_check_traffic(region: str, specs: list[tuple[str, str, list[dict]]]) -> list[bool | None]:
+    """
+    Return, for each (namespace, metric_name, dimensions) spec, whether the
+    metric had any non-zero Sum over the last 7 days, or None when its data
+    could not be fully retrieved.
+
+    All specs are resolved with GetMetricData in batches of up to 500 queries,
+    instead of one GetMetricStatistics round-trip per resource. When there is
+    more than one batch, they are fetched concurrently on a small thread pool.
+    """
+    regional_cw = _client("cloudwatch", region)
     end_time = _now_utc()
-    start_time = end_time - timedelta(days=7)
-    response = regional_cw.get_metric_statistics(
-        Namespace=namespace,
-        MetricName=metric_name,
-        Dimensions=dimensions,
-        StartTime=start_time,
-        EndTime=end_time,
-        Period=3600,
-        Statistics=["Sum"],
-    )
-    for datapoint in response.get("Datapoints", []):
-        if datapoint.get("Sum", 0) > 0:
-            return True
-    return False
-
-
-def _scan_idle_nat_gateways(region: str) -> list[dict]:
-    """Detect NAT gateways with no recent traffic."""
-    regional_ec2 = boto3.client("ec2", region_name=region)
-    findings: list[dict] = []
-    nats = regional_ec2.describe_nat_gateways().get("NatGateways", [])
-    for nat in nats:
-        nat_id = nat["NatGatewayId"]
-        # For simplicity, we treat NAT as idle if BytesOutToDestination has been zero for last 7 days
-        try:
-            has_traffic = _metric_has_traffic(
-                namespace="AWS/NATGateway",
-                metric_name="BytesOutToDestination",
-                dimensions=[{"Name": "NatGatewayId", "Value": nat_id}],
-                region=region,
-            )
-        except Exception:
-            # If metrics are unavailable, do not flag
-            continue
+    start_time = end_time - _TRAFFIC_LOOKBACK
+    period = int(_TRAFFIC_LOOKBACK.total_seconds())
+
+    batches = []
+    for offset in range(0, len(specs), _METRIC_DATA_BATCH_SIZE):
+        batch = specs[offset:offset + _METRIC_DATA_BATCH_SIZE]
+        batches.append(
+            [
+                {
+                    "Id": f"q{offset + i}",
+                    "MetricStat": {
+                        "Metric": {"Namespace": namespace, "MetricName": metric_name, "Dimensions": dimensions},
+                        "Period": period,
+                        "Stat": "Sum",
+                    },
+                    "ReturnData": True,
+                }
+                for i, (namespace, metric_name, dimensions) in enumerate(batch)
+            ]
+        )
 
-        if has_traffic:
-            continue
+    if len(batches) == 1:
+        # The common case (<= 500 resources); we are already on a scan worker thread
+        sums = _fetch_metric_sums(regional_cw, batches[0], start_time, end_time)
+    else:
+        sums = {}
+        with ThreadPoolExecutor(max_workers=min(_METRIC_MAX_WORKERS, len(batches))) as executor:
+            futures = [
+                executor.submit(_fetch_metric_sums, regional_cw, queries, start_time, end_time)
+                for queries in batches
+            ]
+            for future in as_completed(futures):
+                sums.update(future.result())
 
-        # Very rough NAT Gateway price (~32 USD / month)
-        estimated_cost = float(os.getenv("HYGIENE_NAT_MONTH_PRICE", "32.0"))
-
-        findings.append(
-            _build_finding(
-                resource_type="NAT_GATEWAY",
-                resource_id=nat_id,
-                region=region,
-                estimated_monthly_cost=estimated_cost,
-                age_days=None,
-                tags={},
-                risk_level="HIGH",
-                recommended_action="Remove or downsize idle NAT Gateway",
-            )
+    return [sums[f"q{i}"] > 0 if f"q{i}" in sums else None for i in range(len(specs))]
+
+
+def _scan_idle_nat_gateways(region: str) -> Iterator[tuple[int, dict]]:
+    """Detect NAT gateways with no recent traffic."""
+    regional_ec2 = _client("ec2", region)
+    nat_ids: list[str] = []
+    paginator = regional_ec2.get_paginator("describe_nat_gateways")
+    for page in paginator.paginate(PaginationConfig={"PageSize": 1000}):
+        nat_ids.extend(nat["NatGatewayId"] for nat in page.get("NatGateways", []))
+    if not nat_ids:
+        return
+
+    # For simplicity, we treat NAT as idle if BytesOutToDestination has been zero for last 7 days
+    try:
+        traffic = _bulk_check_traffic(
+            region,
+            [
+                ("AWS/NATGateway", "BytesOutToDestination", [{"Name": "NatGatewayId", "Value": nat_id}])
+                for nat_id in nat_ids
+            ],
         )
-    return findings
+    except Exception:
+        # If metrics are unavailable, do not flag
+        return
+
+    cost_units = _to_cost_units(_NAT_MONTH_PRICE)
+    estimated_cost = cost_units / _COST_SCALE
+    for nat_id, has_traffic in zip(nat_ids, traffic):
+        # Only flag when metrics are complete and show no traffic; unknown is not idle
+        if has_traffic is not False:
+            continue
+
+        yield cost_units, {
+            "resource_type": "NAT_GATEWAY",
+            "resource_id": nat_id,
+            "region": region,
+            "estimated_monthly_cost": estimated_cost,
+            "age_days": None,
+            "tags": _EMPTY_TAGS,
+            "risk_level": "HIGH",
+            "recommended_action": "Remove or downsize idle NAT Gateway",
+        }
 
 
-def _scan_idle_load_balancers(region: str) -> list[dict]:
+def _scan_idle_load_balancers(region: str) -> Iterator[tuple[int, dict]]:
     """Detect Application / Network Load Balancers with no traffic."""
-    regional_elb = boto3.client("elbv2", region_name=region)
-    findings: list[dict] = []
+    regional_elb = _client("elbv2", region)
 
+    # (description, upper-cased type) pairs, so the type is normalised once per LB
+    load_balancers: list[tuple[dict, str]] = []
     paginator = regional_elb.get_paginator("describe_load_balancers")
     for page in paginator.paginate():
         for lb_desc in page.get("LoadBalancers", []):
-            lb_arn = lb_desc["LoadBalancerArn"]
-            lb_name = lb_desc["LoadBalancerName"]
-            lb_type = lb_desc.get("Type", "application").upper()
-
-            metric_name = "RequestCount" if lb_type == "APPLICATION" else "ActiveFlowCount"
-            try:
-                has_traffic = _metric_has_traffic(
-                    namespace="AWS/ApplicationELB" if lb_type == "APPLICATION" else "AWS/NetworkELB",
-                    metric_name=metric_name,
-                    dimensions=[{"Name": "LoadBalancer", "Value": lb_arn.split("loadbalancer/")[-1]}],
-                    region=region,
-                )
-            except Exception:
-                continue
-
-            if has_traffic:
-                continue
-
-            # Rough ALB / NLB fixed-price approximation (does not include LCU usage)
-            estimated_cost = float(os.getenv("HYGIENE_ELB_MONTH_PRICE", "18.0"))
-
-            findings.append(
-                _build_finding(
-                    resource_type="LOAD_BALANCER",
-                    resource_id=lb_arn,
-                    region=region,
-                    estimated_monthly_cost=estimated_cost,
-                    age_days=None,
-                    tags={},
-                    risk_level="MEDIUM",
-                    recommended_action="Delete or consolidate idle load balancer",
-                    extra={"name": lb_name, "type": lb_type},
-                )
+            load_balancers.append((lb_desc, lb_desc.get("Type", "application").upper()))
+    if not load_balancers:
+        return
+
+    specs = []
+    for lb_desc, lb_type in load_balancers:
+        specs.append(
+            (
+                "AWS/ApplicationELB" if lb_type == "APPLICATION" else "AWS/NetworkELB",
+                "RequestCount" if lb_type == "APPLICATION" else "ActiveFlowCount",
+                [{"Name": "LoadBalancer", "Value": lb_desc["LoadBalancerArn"].rpartition("loadbalancer/")[2]}],
             )
-    return findings
+        )
+    try:
+        traffic = _bulk_check_traffic(region, specs)
+    except Exception:
+        return
+
+    cost_units = _to_cost_units(_ELB_MONTH_PRICE)
+    estimated_cost = cost_units / _COST_SCALE
+    for (lb_desc, lb_type), has_traffic in zip(load_balancers, traffic):
+        if has_traffic is not False:
+            continue
+
+        yield cost_units, {
+            "resource_type": "LOAD_BALANCER",
+            "resource_id": lb_desc["LoadBalancerArn"],
+            "region": region,
+            "estimated_monthly_cost": estimated_cost,
+            "age_days": None,
+            "tags": _EMPTY_TAGS,
+            "risk_level": "MEDIUM",
+            "recommended_action": "Delete or consolidate idle load balancer",
+            "name": lb_desc["LoadBalancerName"],
+            "type": lb_type,
+        }
 
 
-def _scan_empty_log_groups(region: str) -> list[dict]:
+def _scan_empty_log_groups(region: str) -> Iterator[tuple[int, dict]]:
     """Detect CloudWatch log groups with zero stored bytes."""
-    regional_logs = boto3.client("logs", region_name=region)
-    findings: list[dict] = []
+    regional_logs = _client("logs", region)
     paginator = regional_logs.get_paginator("describe_log_groups")
-    for page in paginator.paginate():
+    # 50 is the largest page DescribeLogGroups allows; there is no server-side storedBytes filter
+    for page in paginator.paginate(PaginationConfig={"PageSize": 50}):
         for lg in page.get("logGroups", []):
             if lg.get("storedBytes", 0) != 0:
                 continue
 
             name = lg["logGroupName"]
             # CloudWatch logs pricing is usage-based; empty group cost is effectively zero, but we keep entry for hygiene.
-            findings.append(
-                _build_finding(
-                    resource_type="CLOUDWATCH_LOG_GROUP",
-                    resource_id=name,
-                    region=region,
-                    estimated_monthly_cost=0.0,
-                    age_days=None,
-                    tags={},
-                    risk_level="LOW",
-                    recommended_action="Delete unused empty log group",
-                )
-            )
-    return findings
+            yield 0, {
+                "resource_type": "CLOUDWATCH_LOG_GROUP",
+                "resource_id": name,
+                "region": region,
+                "estimated_monthly_cost": 0.0,
+                "age_days": None,
+                "tags": _EMPTY_TAGS,
+                "risk_level": "LOW",
+                "recommended_action": "Delete unused empty log group",
+            }
 
 
-def _scan_empty_eks_namespaces(region: str) -> list[dict]:
+def _scan_empty_eks_namespaces(region: str) -> Iterator[tuple[int, dict]]:
     """
     Placeholder for EKS namespace hygiene.
 
     Detecting empty Kubernetes namespaces requires querying the Kubernetes API
     using cluster credentials, which is environment-specific. This function is
-    intentionally conservative and returns an empty list by default.
+    intentionally conservative and yields no findings by default.
 
     You can extend this by:
     - Using `eks.describe_cluster` to obtain cluster endpoints
     - Generating kubeconfig / auth and using the Kubernetes Python client
     """
     # For now, we do not flag EKS namespaces automatically to avoid false positives.
-    return []
+    yield from ()
 
 
 def run_hygiene_scan(regions: list[str] | None = None) -> dict:
     if not regions:
         # Default to the current region only; multi-region can be passed explicitly
-        regions = [os.getenv("AWS_REGION", os.getenv("AWS_DEFAULT_REGION", "us-east-1"))]
-
+        regions = [_DEFAULT_REGION]
+
+    scans = [
+        _scan_unattached_ebs,
+        _scan_old_snapshots,
+        _scan_unused_eips,
+        _scan_idle_nat_gateways,
+        _scan_idle_load_balancers,
+    ]
+    if _SCAN_EMPTY_LOG_GROUPS:
+        scans.append(_scan_empty_log_groups)
+    if _SCAN_EKS:
+        scans.append(_scan_empty_eks_namespaces)
+    tasks = [(scan, region) for region in regions for scan in scans]
+
+    # Every scan is independent and I/O-bound (boto3 HTTP calls), so run all
+    # (scan, region) pairs concurrently; wall-clock ~ the slowest single scan.
+    # Scans are lazy generators; list() drains each one on its worker thread so
+    # the AWS calls happen there, not on the collecting thread. Clients come from
+    # _client(), whose lock keeps creation off the non-thread-safe default session.
+    #
+    # Results are merged in submission order, so findings stay grouped by region
+    # then scan type. The first failing scan in that order is re-raised; scans that
+    # have not started are cancelled, but ones already in flight run to completion.
     all_findings: list[dict] = []
-    for region in regions:
-        all_findings.extend(_scan_unattached_ebs(region))
-        all_findings.extend(_scan_old_snapshots(region))
-        all_findings.extend(_scan_unused_eips(region))
-        all_findings.extend(_scan_idle_nat_gateways(region))
-        all_findings.extend(_scan_idle_load_balancers(region))
-        all_findings.extend(_scan_empty_log_groups(region))
-        all_findings.extend(_scan_empty_eks_namespaces(region))
-
-    total_estimated_savings = sum(f.get("estimated_monthly_cost", 0.0) or 0.0 for f in all_findings)
+    total_cost_units = 0
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(list, scan(region)) for scan, region in tasks]
+        try:
+            for i, future in enumerate(futures):
+                for cost_units, finding in future.result():
+                    all_findings.append(finding)
+                    total_cost_units += cost_units
+                # Drop the merged per-scan list rather than holding it until every scan is merged
+                futures[i] = None
+        except Exception:
+            for future in futures:
+                if future is not None:
+                    future.cancel()
+            raise
 
     return {
         "findings": all_findings,
         "summary": {
-            "total_estimated_savings": round(total_estimated_savings, 4),
+            "total_estimated_savings": total_cost_units / _COST_SCALE,
             "total_resources": len(all_findings),
         },
     }
@@ -342,7 +485,7 @@ def lambda_handler(event, context):
 
         response_body = {
             "TEXT": {
-                "body": json.dumps(scan_result)
+                "body": _to_json(scan_result)
             }
         }
 
@@ -362,7 +505,7 @@ def lambda_handler(event, context):
     except Exception as exc:
         error_body = {
             "TEXT": {
-                "body": json.dumps(
+                "body": _to_json(
                     {
                         "error": str(exc),
                         "message": "Hygiene scan failed",
@@ -47,10 +47,13 @@ def lambda_handler(event, context):
         inputText=prompt,
     )
 
-    completion = ""
+    # Collect raw bytes and decode once, so multi-byte characters split across chunks survive
+    buf = bytearray()
     for event_stream in response.get("completion", []):
-        if "chunk" in event_stream and event_stream["chunk"].get("bytes"):
-            completion += event_stream["chunk"]["bytes"].decode("utf-8", errors="replace")
+        chunk_bytes = event_stream.get("chunk", {}).get("bytes")
+        if chunk_bytes:
+            buf.extend(chunk_bytes)
+    completion = buf.decode("utf-8", errors="replace")
 
     if not completion.strip():
         completion = "(No report content generated.)"